@@ -7,14 +7,35 @@ import requests
 import io
 from typing import Optional, List
 import re
+import logging
+import threading
+from collections import OrderedDict
+
+# Log level comes from the environment; WARNING keeps per-request logging quiet in production
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "WARNING").upper()
+# getLevelName returns the numeric level for known names, and a string otherwise
+_log_level = logging.getLevelName(LOG_LEVEL)
+_log_level_known = isinstance(_log_level, int)
+if not _log_level_known:
+    _log_level = logging.WARNING
+logging.basicConfig(level=_log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger("resume")
+if not _log_level_known:
+    logger.warning("Unknown LOG_LEVEL %r - using WARNING", LOG_LEVEL)
 
 # Import parsing libraries
 try:
     import pdfplumber  # For PDF parsing
     import docx  # For DOCX parsing
 except ImportError:
-    print("Warning: Missing libraries. Please install with:")
-    print("pip install pdfplumber python-docx requests")
+    logger.warning("Missing libraries. Please install with: pip install pdfplumber python-docx requests")
+
+# Optional fast path for PDF text; pdfplumber is used alone when it is missing
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+    logger.warning("pypdfium2 is not installed - using pdfplumber for all PDFs")
 
 app = FastAPI()
 
@@ -22,6 +43,22 @@ PORT= PORT = int(os.environ.get("PORT", 8000))
 
 ALLOWED_ORIGINS = os.environ.get("ALLOWED_ORIGINS", "http://localhost:5173").split(",")
 
+# Below this many characters the pypdfium2 result is retried with pdfplumber
+MIN_FAST_PDF_TEXT_LENGTH = 50
+
+# Resume download settings
+DOWNLOAD_CHUNK_SIZE = 16384
+DOWNLOAD_TIMEOUT = 30
+
+# Parsed resumes and extracted text are cached per URL and ETag/Last-Modified
+CACHE_MAX_SIZE = 512
+_PARSE_CACHE = OrderedDict()
+_TEXT_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+# Serializes all pypdfium2 calls; the endpoints run concurrently on FastAPI's threadpool
+_PDFIUM_LOCK = threading.Lock()
+
 # Enable CORS for communication with React
 app.add_middleware(
     CORSMiddleware,
@@ -38,6 +75,120 @@ app.add_middleware(
 class ResumeURL(BaseModel):
     url: str
 
+# Response models for the parsed resume
+class EducationItem(BaseModel):
+    degree: str
+    institution: str
+    year: str
+
+class ExperienceItem(BaseModel):
+    title: str
+    company: str
+    duration: str
+
+class ProjectItem(BaseModel):
+    name: str
+    description: str
+
+class ParsedResume(BaseModel):
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    skills: List[str] = []
+    education: List[EducationItem] = []
+    experience: List[ExperienceItem] = []
+    projects: List[ProjectItem] = []
+
+class ParseResumeResponse(BaseModel):
+    parsedData: ParsedResume
+
+class ViewResumeResponse(BaseModel):
+    text: str
+
+# Common skills to look for - expand as needed
+SKILL_KEYWORDS = [
+    "python", "javascript", "react", "angular", "vue", "node.js", "express",
+    "mongodb", "sql", "mysql", "postgresql", "nosql", "firebase", "aws", "azure",
+    "gcp", "docker", "kubernetes", "ci/cd", "jenkins", "git", "github", "gitlab",
+    "html", "css", "sass", "less", "bootstrap", "tailwind", "typescript",
+    "java", "c++", "c#", ".net", "php", "ruby", "go", "rust", "swift",
+    "android", "ios", "flutter", "react native", "electron",
+    "machine learning", "deep learning", "ai", "data science", "data analysis",
+    "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy",
+    "agile", "scrum", "kanban", "jira", "confluence",
+    "communication", "leadership", "project management", "team work",
+    "problem solving", "critical thinking", "time management"
+]
+
+DEGREE_INDICATORS = ['bachelor', 'master', 'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'mba', 'b.sc', 'm.sc', 'b.com', 'm.com', 'b.a', 'm.a']
+
+# Regex patterns used by the extraction functions, compiled once at import
+# Lines containing any of these can't be the candidate's name
+_NAME_NEG_RE = re.compile(r'@|http|resume|cv|email|phone', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# Match various phone number formats
+_PHONE_RE = re.compile(r'(\+\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})')
+# All skills in one alternation (longest first) so the text is scanned once.
+# Matched against lowercased text, which is faster than an IGNORECASE scan
+_SKILLS_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(skill) for skill in sorted(SKILL_KEYWORDS, key=len, reverse=True)) + r')\b'
+)
+
+_EDU_SPLIT_RE = re.compile(r'\n(?=\d{4}|\b(?:' + '|'.join(DEGREE_INDICATORS) + r')\b)')
+_DEGREE_RE = re.compile(r'\b(?:' + '|'.join(DEGREE_INDICATORS) + r')[s]?\b.*?(?:\n|$)', re.IGNORECASE)
+_INSTITUTION_RES = [
+    re.compile(r'\b(?:university|college|institute|school) of [\w\s]+', re.IGNORECASE),
+    re.compile(r'[\w\s]+ (?:university|college|institute|school)\b', re.IGNORECASE),
+]
+_YEAR_RE = re.compile(r'(\b20\d{2}\b|\b19\d{2}\b)(?:\s*-\s*(?:\b20\d{2}\b|\b19\d{2}\b|present|current|now))?', re.IGNORECASE)
+
+# Date ranges like "Jan 2020 - Mar 2022", "2019 - 2021" or "2021 - Present",
+# used both to split experience entries and to extract their duration
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*'
+_DATE_RANGE_RE = re.compile(
+    rf'\b{_MONTH}\s+\d{{4}}\s*[-–—]\s*{_MONTH}\s+\d{{4}}|\b\d{{4}}\s*[-–—]\s*(?:\d{{4}}|present|current|now)\b',
+    re.IGNORECASE
+)
+_YEAR_LINE_SPLIT_RE = re.compile(r'\n(?=.*\b(?:19|20)\d{2}\b)')
+_TITLE_RE = re.compile(r'^([A-Z][A-Za-z \t]{2,30}(?:Developer|Engineer|Manager|Designer|Analyst|Consultant|Director|Lead|Architect|Specialist|Intern))\b', re.MULTILINE)
+_COMPANY_RES = [
+    re.compile(r'(?:at|with|for) ([\w\s]+)'),
+    re.compile(r'^([\w\s]+) (?:Inc\.|LLC|Ltd\.)'),
+    re.compile(r'^([\w\s,]+)(?:\n|$)'),
+]
+
+_PROJECT_SPLIT_RE = re.compile(r'\n(?=•|\*|\-|\d+\.|\d+\)|\w+:)')
+
+# Section header keywords mapped to the section they start
+_SECTION_STARTS = {
+    'projects': 'projects',
+    'experience': 'experience',
+    'employment': 'experience',
+    'work history': 'experience',
+    'career': 'experience',
+    'education': 'education',
+    'academic': 'education',
+}
+# When a header names several sections the more specific one wins ("Academic Projects")
+_SECTION_PRIORITY = ['projects', 'experience', 'education']
+# Header keywords that end each section without starting another one
+_SECTION_ENDS = {
+    'education': {'experience', 'work', 'employment', 'professional', 'projects', 'skills'},
+    'experience': {'education', 'projects', 'skills', 'certifications'},
+    'projects': {'experience', 'education', 'skills', 'certifications'},
+}
+_SECTION_HDR_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(header)
+        for header in sorted(set(_SECTION_STARTS).union(*_SECTION_ENDS.values()), key=len, reverse=True)
+    ) + r')\b',
+    re.IGNORECASE
+)
+
+# Entries consisting only of a section heading are skipped
+_EXPERIENCE_HEADINGS = frozenset(['experience', 'work experience', 'employment history'])
+_PROJECT_HEADINGS = frozenset(['projects', 'personal projects', 'academic projects'])
+
 
 
 # Home endpoint to verify the API is running
@@ -46,96 +197,204 @@ class ResumeURL(BaseModel):
 def read_root():
     return {"status": "ok", "message": "Resume parser service is running"}
 
-# File type detection functions
-def is_pdf(file_bytes):
+# File type detection function
+def detect_file_type(file_bytes):
+    """Return 'pdf' or 'docx' based on the file's magic bytes, or None if unknown"""
+    head = file_bytes[:4]
     # PDF files start with %PDF
-    return file_bytes[:4] == b'%PDF'
-
-def is_docx(file_bytes):
+    if head == b'%PDF':
+        return 'pdf'
     # DOCX files are ZIP files with specific patterns
-    return file_bytes[:4] == b'PK\x03\x04'
+    if head == b'PK\x03\x04':
+        return 'docx'
+    return None
+
+# Download functions
+def is_supported_content_type(content_type):
+    return 'pdf' in content_type or 'word' in content_type or 'docx' in content_type
+
+def download_file(url):
+    """Stream a file into memory, returning its bytes and lowercased Content-Type.
+
+    Stops after the first chunk when neither the magic bytes nor the
+    Content-Type point to a PDF or DOCX, since callers won't parse it.
+    """
+    # PDF and DOCX files are already compressed, so skip transfer compression
+    headers = {"Accept-Encoding": "identity"}
+    with requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers=headers) as response:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '').lower()
+
+        buffer = io.BytesIO()
+        type_checked = False
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
+            if not type_checked and buffer.tell() >= 4:
+                type_checked = True
+                # Copy just the header; getvalue() would share the buffer and
+                # force a copy of everything read so far on the next write
+                head = bytes(buffer.getbuffer()[:4])
+                if not (detect_file_type(head) or is_supported_content_type(content_type)):
+                    logger.info("Unsupported file signature - stopping download early")
+                    break
+
+    return buffer.getvalue(), content_type
+
+# Cache functions
+def get_cache_key(url):
+    """Return a (url, validator) cache key from a HEAD request.
+
+    Returns None when the server sends neither ETag nor Last-Modified,
+    as the cached result could then never be validated.
+    """
+    try:
+        response = requests.head(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+    except requests.RequestException as e:
+        logger.warning("HEAD request failed, skipping cache: %s", e)
+        return None
+    if not response.ok:
+        return None
+    validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+    return (url, validator) if validator else None
+
+def cache_get(cache, key):
+    if key is None:
+        return None
+    with _CACHE_LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+def cache_put(cache, key, value):
+    if key is None:
+        return
+    with _CACHE_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > CACHE_MAX_SIZE:
+            cache.popitem(last=False)
 
 # Text extraction functions
+def extract_text_from_pdf_fast(file_bytes):
+    try:
+        # PDFium is not thread-safe, so only one document is open at a time
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_bytes)
+            try:
+                page_texts = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_texts.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        # pdfium separates lines with \r\n
+        text = "\n".join(page_texts).replace("\r\n", "\n")
+        logger.info("Extracted %d characters from PDF with pypdfium2", len(text))
+        return text
+    except Exception as e:
+        logger.error("Error extracting PDF text with pypdfium2: %s", e)
+        return ""
+
+def extract_pdf_text(file_bytes):
+    # Try pypdfium2 first and only fall back to pdfplumber when it finds almost no text
+    text = extract_text_from_pdf_fast(file_bytes) if pdfium else ""
+    if len(text) < MIN_FAST_PDF_TEXT_LENGTH:
+        logger.info("Little text found with pypdfium2 - falling back to pdfplumber")
+        text = extract_text_from_pdf(file_bytes)
+    return text
+
 def extract_text_from_pdf(file_bytes):
     try:
         with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-            text = ""
+            page_texts = []
             for page in pdf.pages:
                 extracted = page.extract_text()
+                # Release the page's cached layout objects before moving on
+                page.close()
                 if extracted:
-                    text += extracted + "\n"
-        print(f"Extracted {len(text)} characters from PDF")
+                    page_texts.append(extracted + "\n")
+        text = "".join(page_texts)
+        logger.info("Extracted %d characters from PDF", len(text))
         return text
     except Exception as e:
-        print(f"Error extracting PDF text: {e}")
+        logger.error("Error extracting PDF text: %s", e)
         return ""
 
 # Add these new extraction functions to main.py
 
-def extract_education(text):
-    """Extract education information from resume text"""
-    education = []
-    
-    # Keywords that indicate education sections
-    education_indicators = ['education', 'academic', 'degree', 'university', 'college', 'school', 'institute']
-    degree_indicators = ['bachelor', 'master', 'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'mba', 'b.sc', 'm.sc', 'b.com', 'm.com', 'b.a', 'm.a']
-    
-    # Find education section
-    lines = text.split('\n')
-    in_education_section = False
-    education_section_text = ""
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        
-        # Detect education section header
-        if any(edu_ind in line_lower for edu_ind in education_indicators) and len(line_lower) < 30:
-            in_education_section = True
-            education_section_text += line + "\n"
+def _iter_split(pattern, text):
+    """Yield the pieces of text between matches of pattern, like pattern.split() but lazily"""
+    start = 0
+    for match in pattern.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
+def _split_sections(text):
+    """Split resume text into education, experience and projects sections in one pass"""
+    sections = {'education': [], 'experience': [], 'projects': []}
+    # Like the per-section scans this replaces, each section is taken once and never reopened
+    finished_sections = set()
+    current_section = None
+
+    for line in text.splitlines():
+        line_stripped = line.strip()
+        if not line_stripped:
             continue
-            
-        # Detect end of education section by checking for other section headers
-        if in_education_section and line_lower and len(line_lower) < 30:
-            if any(x in line_lower for x in ['experience', 'work', 'employment', 'professional', 'projects', 'skills']):
-                in_education_section = False
-                break
-                
-        # Add lines to education section
-        if in_education_section and line.strip():
-            education_section_text += line + "\n"
+
+        # Short lines mentioning a section keyword are treated as section headers
+        if len(line_stripped) < 30:
+            headers = {header.lower() for header in _SECTION_HDR_RE.findall(line_stripped)}
+            started = [
+                _SECTION_STARTS[header] for header in headers
+                if header in _SECTION_STARTS and _SECTION_STARTS[header] not in finished_sections
+            ]
+            next_section = current_section
+            if started:
+                next_section = min(started, key=_SECTION_PRIORITY.index)
+            elif current_section and headers & _SECTION_ENDS[current_section]:
+                next_section = None
+
+            if next_section != current_section:
+                if current_section:
+                    finished_sections.add(current_section)
+                current_section = next_section
+
+        if current_section:
+            sections[current_section].append(line)
+
+    return {name: '\n'.join(section_lines) for name, section_lines in sections.items()}
+
+def extract_education(education_section_text):
+    """Extract education information from the education section text"""
+    education = []
     
     # Process education section
     if education_section_text:
         # Try to extract individual education entries
-        entries = re.split(r'\n(?=\d{4}|\b(?:' + '|'.join(degree_indicators) + r')\b)', education_section_text)
+        entries = _iter_split(_EDU_SPLIT_RE, education_section_text)
         
         for entry in entries:
             if len(entry.strip()) < 10:
                 continue
                 
             # Try to extract degree
-            degree = None
-            for indicator in degree_indicators:
-                match = re.search(r'\b' + indicator + r'[s]?\b.*?(?:\n|$)', entry, re.IGNORECASE)
-                if match:
-                    degree = match.group(0).strip()
-                    break
+            degree_match = _DEGREE_RE.search(entry)
+            degree = degree_match.group(0).strip() if degree_match else None
             
             # Try to extract institution
-            institution_patterns = [
-                r'\b(?:university|college|institute|school) of [\w\s]+',
-                r'[\w\s]+ (?:university|college|institute|school)\b'
-            ]
             institution = None
-            for pattern in institution_patterns:
-                match = re.search(pattern, entry, re.IGNORECASE)
+            for institution_re in _INSTITUTION_RES:
+                match = institution_re.search(entry)
                 if match:
                     institution = match.group(0).strip()
                     break
             
             # Try to extract year
-            year_pattern = r'(\b20\d{2}\b|\b19\d{2}\b)(?:\s*-\s*(?:\b20\d{2}\b|\b19\d{2}\b|present|current|now))?'
-            year_match = re.search(year_pattern, entry, re.IGNORECASE)
+            year_match = _YEAR_RE.search(entry)
             year = year_match.group(0) if year_match else None
             
             if degree or institution:
@@ -147,76 +406,39 @@ def extract_education(text):
     
     return education
 
-def extract_experience(text):
-    """Extract work experience from resume text"""
+def extract_experience(experience_section_text):
+    """Extract work experience from the experience section text"""
     experience = []
     
-    # Keywords that indicate experience sections
-    experience_indicators = ['experience', 'employment', 'work history', 'professional experience', 'career']
-    
-    # Find experience section
-    lines = text.split('\n')
-    in_experience_section = False
-    experience_section_text = ""
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        
-        # Detect experience section header
-        if any(exp_ind in line_lower for exp_ind in experience_indicators) and len(line_lower) < 30:
-            in_experience_section = True
-            experience_section_text += line + "\n"
-            continue
-            
-        # Detect end of experience section
-        if in_experience_section and line_lower and len(line_lower) < 30:
-            if any(x in line_lower for x in ['education', 'projects', 'skills', 'certifications']):
-                in_experience_section = False
-                break
-                
-        # Add lines to experience section
-        if in_experience_section and line.strip():
-            experience_section_text += line + "\n"
-    
     # Process experience section
     if experience_section_text:
-        # Date pattern to split entries
-        date_pattern = r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]* \d{4}\s*[-–—]\s*(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]* \d{4}|\b\d{4}\s*[-–—]\s*\d{4}|\b\d{4}\s*[-–—]\s*(present|current|now)\b'
-        
         # Try to split by dates or company names
-        entries = re.split(date_pattern, experience_section_text, flags=re.IGNORECASE)
+        entries = _DATE_RANGE_RE.split(experience_section_text)
         
         # If that didn't work well, try splitting by newlines with year patterns
         if len(entries) <= 1:
-            entries = re.split(r'\n(?=.*\b(?:19|20)\d{2}\b)', experience_section_text)
+            entries = _YEAR_LINE_SPLIT_RE.split(experience_section_text)
         
         for entry in entries:
-            if len(entry.strip()) < 15 or entry.strip().lower() in ['experience', 'work experience', 'employment history']:
+            entry_stripped = entry.strip()
+            if len(entry_stripped) < 15 or entry_stripped.lower() in _EXPERIENCE_HEADINGS:
                 continue
                 
             # Try to extract job title
-            title = None
-            title_candidates = re.findall(r'^([A-Z][A-Za-z\s]{2,30}(?:Developer|Engineer|Manager|Designer|Analyst|Consultant|Director|Lead|Architect|Specialist|Intern))', entry)
-            if title_candidates:
-                title = title_candidates[0].strip()
+            title_match = _TITLE_RE.search(entry)
+            title = title_match.group(1).strip() if title_match else None
             
             # Try to extract company
             company = None
-            company_patterns = [
-                r'(?:at|with|for) ([\w\s]+)',
-                r'^([\w\s]+) (?:Inc\.|LLC|Ltd\.)',
-                r'^([\w\s,]+)(?:\n|$)'
-            ]
-            for pattern in company_patterns:
-                company_matches = re.search(pattern, entry)
+            for company_re in _COMPANY_RES:
+                company_matches = company_re.search(entry)
                 if company_matches:
                     company = company_matches.group(1).strip()
                     break
             
             # Try to extract duration
             duration = None
-            duration_pattern = r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]* \d{4}\s*[-–—]\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]* \d{4}|\b\d{4}\s*[-–—]\s*\d{4}|\b\d{4}\s*[-–—]\s*(?:present|current|now)\b'
-            duration_match = re.search(duration_pattern, entry, re.IGNORECASE)
+            duration_match = _DATE_RANGE_RE.search(entry)
             if duration_match:
                 duration = duration_match.group(0)
             
@@ -229,45 +451,18 @@ def extract_experience(text):
     
     return experience
 
-def extract_projects(text):
-    """Extract project information from resume text"""
+def extract_projects(project_section_text):
+    """Extract project information from the projects section text"""
     projects = []
     
-    # Keywords that indicate projects sections
-    project_indicators = ['projects', 'personal projects', 'academic projects']
-    
-    # Find projects section
-    lines = text.split('\n')
-    in_project_section = False
-    project_section_text = ""
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        
-        # Detect projects section header
-        if any(proj_ind in line_lower for proj_ind in project_indicators) and len(line_lower) < 30:
-            in_project_section = True
-            project_section_text += line + "\n"
-            continue
-            
-        # Detect end of projects section
-        if in_project_section and line_lower and len(line_lower) < 30:
-            if any(x in line_lower for x in ['experience', 'education', 'skills', 'certifications']):
-                in_project_section = False
-                break
-                
-        # Add lines to project section
-        if in_project_section and line.strip():
-            project_section_text += line + "\n"
-    
     # Process project section
     if project_section_text:
         # Try to split by project names (often start with bullet points or numbers)
-        entries = re.split(r'\n(?=•|\*|\-|\d+\.|\d+\)|\w+:)', project_section_text)
+        entries = _iter_split(_PROJECT_SPLIT_RE, project_section_text)
         
         for entry in entries:
             entry = entry.strip()
-            if len(entry) < 15 or entry.lower() in ['projects', 'personal projects', 'academic projects']:
+            if len(entry) < 15 or entry.lower() in _PROJECT_HEADINGS:
                 continue
             
             # Try to extract project name (usually the first line)
@@ -285,93 +480,86 @@ def extract_projects(text):
     
     return projects
 
+def _paragraph_texts(doc):
+    # paragraph.text walks the paragraph's XML runs, so read it once per paragraph
+    for paragraph in doc.paragraphs:
+        paragraph_text = paragraph.text
+        if paragraph_text:
+            yield paragraph_text
+
 def extract_text_from_docx(file_bytes):
     try:
         doc = docx.Document(io.BytesIO(file_bytes))
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs if paragraph.text])
-        print(f"Extracted {len(text)} characters from DOCX")
+        text = "\n".join(_paragraph_texts(doc))
+        logger.info("Extracted %d characters from DOCX", len(text))
         return text
     except Exception as e:
-        print(f"Error extracting DOCX text: {e}")
+        logger.error("Error extracting DOCX text: %s", e)
         return ""
 
 # Information extraction functions
 def extract_name(text):
     # Simplified name extraction - first few lines often contain the name
-    lines = text.split('\n')
+    # Only split off the first 5 lines instead of the whole resume
+    lines = text.split('\n', 5)
     for line in lines[:5]:  # Check first 5 lines
         # If line is short and doesn't contain common words, it might be a name
-        if 5 < len(line) < 40 and not any(x in line.lower() for x in ['@', 'http', 'resume', 'cv', 'email', 'phone']):
+        if 5 < len(line) < 40 and not _NAME_NEG_RE.search(line):
             return line.strip()
     return None
 
 def extract_email(text):
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else None
 
 def extract_phone(text):
-    # Match various phone number formats
-    phone_pattern = r'(\+\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
-    match = re.search(phone_pattern, text)
+    match = _PHONE_RE.search(text)
     return match.group(0) if match else None
 
 def extract_skills(text):
-    # Common skills to look for - expand as needed
-    skill_keywords = [
-        "python", "javascript", "react", "angular", "vue", "node.js", "express", 
-        "mongodb", "sql", "mysql", "postgresql", "nosql", "firebase", "aws", "azure",
-        "gcp", "docker", "kubernetes", "ci/cd", "jenkins", "git", "github", "gitlab",
-        "html", "css", "sass", "less", "bootstrap", "tailwind", "typescript",
-        "java", "c++", "c#", ".net", "php", "ruby", "go", "rust", "swift",
-        "android", "ios", "flutter", "react native", "electron",
-        "machine learning", "deep learning", "ai", "data science", "data analysis",
-        "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy",
-        "agile", "scrum", "kanban", "jira", "confluence",
-        "communication", "leadership", "project management", "team work",
-        "problem solving", "critical thinking", "time management"
-    ]
-    
-    found_skills = []
-    for skill in skill_keywords:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text.lower()):
-            found_skills.append(skill)
-    
-    return found_skills
+    matched = {match.group(1) for match in _SKILLS_RE.finditer(text.lower())}
+    return [skill for skill in SKILL_KEYWORDS if skill in matched]
 
 
 
 # Resume parsing endpoint
-@app.post("/parse-resume")
-async def parse_resume(resume_url: ResumeURL):
+# The endpoints are plain functions so FastAPI runs their blocking download and
+# parsing work in its threadpool instead of on the event loop
+@app.post("/parse-resume", response_model=ParseResumeResponse)
+def parse_resume(resume_url: ResumeURL):
     try:
-        print(f"Received URL: {resume_url.url}")
+        logger.info("Received URL: %s", resume_url.url)
+        
+        # Return the cached result if this exact file was parsed before
+        cache_key = get_cache_key(resume_url.url)
+        cached_data = cache_get(_PARSE_CACHE, cache_key)
+        if cached_data is not None:
+            logger.info("Returning cached parse result")
+            return {"parsedData": cached_data}
         
         # Download the file from the URL
-        response = requests.get(resume_url.url)
-        response.raise_for_status()
-        file_bytes = response.content
-        print(f"Downloaded {len(file_bytes)} bytes")
+        file_bytes, content_type = download_file(resume_url.url)
+        logger.info("Downloaded %d bytes", len(file_bytes))
         
         # Determine file type by examining file content
-        if is_pdf(file_bytes):
-            print("Detected PDF file")
-            text = extract_text_from_pdf(file_bytes)
-        elif is_docx(file_bytes):
-            print("Detected DOCX file")
+        file_type = detect_file_type(file_bytes)
+        if file_type == 'pdf':
+            logger.info("Detected PDF file")
+            text = extract_pdf_text(file_bytes)
+        elif file_type == 'docx':
+            logger.info("Detected DOCX file")
             text = extract_text_from_docx(file_bytes)
         else:
-            print("Unknown file format - examining content type")
-            content_type = response.headers.get('Content-Type', '').lower()
+            logger.info("Unknown file format - examining content type")
             
             if 'pdf' in content_type:
-                print("Content-Type indicates PDF")
-                text = extract_text_from_pdf(file_bytes)
+                logger.info("Content-Type indicates PDF")
+                text = extract_pdf_text(file_bytes)
             elif 'word' in content_type or 'docx' in content_type:
-                print("Content-Type indicates DOCX")
+                logger.info("Content-Type indicates DOCX")
                 text = extract_text_from_docx(file_bytes)
             else:
-                print(f"Unsupported format: {content_type} - returning dummy data")
+                logger.warning("Unsupported format: %s - returning dummy data", content_type)
                 
                 # For testing purposes, return dummy data
                 parsed_data = {
@@ -390,7 +578,7 @@ async def parse_resume(resume_url: ResumeURL):
         
         # If we got here, we have extracted text
         if not text or len(text) < 10:
-            print("Failed to extract meaningful text from document")
+            logger.warning("Failed to extract meaningful text from document")
             raise HTTPException(status_code=422, detail="Could not extract text from document")
         
         # Extract information from the text
@@ -398,9 +586,10 @@ async def parse_resume(resume_url: ResumeURL):
         email = extract_email(text)
         phone = extract_phone(text)
         skills = extract_skills(text)
-        education = extract_education(text)
-        experience = extract_experience(text)
-        projects = extract_projects(text)
+        sections = _split_sections(text)
+        education = extract_education(sections['education'])
+        experience = extract_experience(sections['experience'])
+        projects = extract_projects(sections['projects'])
         
         # Create response
         parsed_data = {
@@ -413,33 +602,40 @@ async def parse_resume(resume_url: ResumeURL):
             "projects": projects
         }
         
-        print(f"Successfully parsed resume: {name}, {email}, {len(skills)} skills , {len(education)} edu, {len(experience)} exp, {len(projects)} proj")
+        logger.info(
+            "Successfully parsed resume: %s, %s, %d skills, %d edu, %d exp, %d proj",
+            name, email, len(skills), len(education), len(experience), len(projects)
+        )
+        cache_put(_PARSE_CACHE, cache_key, parsed_data)
         return {"parsedData": parsed_data}
         
     except requests.RequestException as e:
-        print(f"Request error: {e}")
+        logger.warning("Request error: %s", e)
         raise HTTPException(status_code=400, detail=f"Error downloading file: {str(e)}")
     except Exception as e:
-        print(f"Processing error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Processing error: %s", e)
         raise HTTPException(status_code=500, detail=f"Error parsing resume: {str(e)}")
     
 
-@app.post("/view-resume")
-async def view_resume(data: ResumeURL):
+@app.post("/view-resume", response_model=ViewResumeResponse)
+def view_resume(data: ResumeURL):
     try:
+        cache_key = get_cache_key(data.url)
+        cached_text = cache_get(_TEXT_CACHE, cache_key)
+        if cached_text is not None:
+            return {"text": cached_text}
+
         # Fetch the resume from the given URL
-        response = requests.get(data.url)
-        if response.status_code != 200:
+        try:
+            file_bytes, _ = download_file(data.url)
+        except requests.RequestException:
             raise HTTPException(status_code=400, detail="Could not fetch resume from URL")
 
-        file_bytes = response.content
-
         # Determine file type and extract text
-        if is_pdf(file_bytes):
-            extracted_text = extract_text_from_pdf(file_bytes)
-        elif is_docx(file_bytes):
+        file_type = detect_file_type(file_bytes)
+        if file_type == 'pdf':
+            extracted_text = extract_pdf_text(file_bytes)
+        elif file_type == 'docx':
             extracted_text = extract_text_from_docx(file_bytes)
         else:
             raise HTTPException(status_code=415, detail="Unsupported file format")
@@ -448,6 +644,7 @@ async def view_resume(data: ResumeURL):
             raise HTTPException(status_code=422, detail="Could not extract text from the resume")
 
         # Return the raw extracted text
+        cache_put(_TEXT_CACHE, cache_key, extracted_text)
         return {"text": extracted_text}
 
     except Exception as e:
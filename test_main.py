@@ -0,0 +1,87 @@
+from main import _split_sections, extract_experience, extract_projects
+
+
+def test_work_inside_a_word_does_not_end_projects():
+    text = "\n".join([
+        "PROJECTS",
+        "- Social Network App",
+        "Built a social feed with React and Firebase",
+        "- Job Recommender",
+        "Matches resumes to job listings",
+        "SKILLS",
+        "Python, React",
+    ])
+    sections = _split_sections(text)
+
+    assert "Social Network App" in sections['projects']
+    assert "Job Recommender" in sections['projects']
+    assert len(extract_projects(sections['projects'])) == 2
+
+
+def test_work_inside_a_word_does_not_end_experience():
+    text = "\n".join([
+        "EXPERIENCE",
+        "Network Engineer",
+        "with Initech Ltd",
+        "2019 - 2021",
+        "EDUCATION",
+        "Bachelor of Science, State University 2019",
+    ])
+    sections = _split_sections(text)
+
+    assert "Network Engineer" in sections['experience']
+    assert "Initech Ltd" in sections['experience']
+    assert "Bachelor" not in sections['experience']
+    assert extract_experience(sections['experience'])
+
+
+def test_professional_ends_education_but_not_experience():
+    text = "\n".join([
+        "EDUCATION",
+        "Bachelor of Science, State University 2019",
+        "Professional Summary",
+        "Engineer focused on backend systems",
+        "WORK EXPERIENCE",
+        "Software Engineer at Acme Corp",
+        "Professional Development",
+        "Mentored junior developers on testing",
+    ])
+    sections = _split_sections(text)
+
+    assert "Engineer focused" not in sections['education']
+    assert "Mentored junior developers" in sections['experience']
+
+
+def test_closed_sections_are_not_reopened():
+    text = "\n".join([
+        "EDUCATION",
+        "Bachelor of Science, State University 2019",
+        "EXPERIENCE",
+        "Software Engineer at Acme Corp",
+        "2019 - 2021",
+        "SKILLS",
+        "Python, React",
+        "ACHIEVEMENTS",
+        "Academic Excellence Award",
+        "Career Fair Volunteer",
+        "Reviewed resumes and interviews for the fair 2017",
+    ])
+    sections = _split_sections(text)
+
+    assert "Academic Excellence Award" not in sections['education']
+    assert "Career Fair Volunteer" not in sections['experience']
+    assert "for the fair 2017" not in sections['experience']
+
+
+def test_section_header_is_not_part_of_the_job_title():
+    text = "\n".join([
+        "EXPERIENCE",
+        "Software Engineer at Acme Corp",
+        "2019 - 2021",
+        "Work Experience",
+        "Intern with Initech Ltd",
+    ])
+    experience = extract_experience(_split_sections(text)['experience'])
+
+    assert experience[0]["title"] == "Software Engineer"
+    assert all("\n" not in entry["title"] for entry in experience)